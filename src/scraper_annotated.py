@@ -37,13 +37,21 @@ Outputs
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import atexit
+import mmap
+import os
 import re
 import sqlite3
+import threading
 
 import pandas as pd
-from bs4 import BeautifulSoup
+import pyarrow as pa
+import pyarrow.csv as pv
+from lxml import etree
 
 # ------------------------------
 # Paths and basic configuration
@@ -59,10 +67,54 @@ SITE_DIR = ROOT / "site"
 OUTPUT_DIR = ROOT / "output"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
+# Demo pages are named page1.html, page2.html, ... which lets us list them
+# up front instead of discovering them one "next" link at a time.
+_PAGE_NAME_RE = re.compile(r"page(\d+)\.html")
+
+# Columns of the company table, in page order.
+COLUMNS = ["CompanyID", "CompanyName", "Category", "Email", "Phone", "Country"]
+
+# Number of threads used to read page files concurrently.
+READ_WORKERS = 8
+
+# Parsing only moves to a process pool once there's at least this much HTML:
+# starting worker processes costs several ms each, far more than parsing a
+# few small pages inline.
+PARALLEL_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+# Text columns are cleaned as Arrow-backed strings: one contiguous UTF-8
+# buffer per column and vectorized .str kernels instead of a Python str
+# object per cell. (Requires pyarrow.)
+TEXT_DTYPE = "string[pyarrow]"
+
 
 # ------------------------------
 # Cleaning helpers
 # ------------------------------
+
+# Everything except digits and '+' (stripped from phone numbers). "Digit"
+# means any Unicode decimal digit (category Nd), as in Python's \d and
+# str.isdecimal.
+_PHONE_STRIP_RE = re.compile(r"[^\d+]")
+
+# The same set for the vectorized path, which runs on Arrow's RE2 engine:
+# there \d is ASCII-only, so spell out the Unicode category instead.
+_PHONE_STRIP_ARROW_PATTERN = r"[^\p{Nd}+]"
+
+# Lowercased placeholders that mean "no value".
+_MISSING = frozenset({"n/a", "na", "none"})
+
+# Known country variants (lowercased) map → canonical value
+_COUNTRY_MAP = {
+    "usa": "United States",
+    "united states": "United States",
+    "canada": "Canada",
+    "uk": "United Kingdom",
+    "united kingdom": "United Kingdom",
+    "mexico": "Mexico",
+}
+
+
 def normalize_phone(raw: str) -> str:
     """
     Normalize phone numbers into a simplified canonical format.
@@ -74,6 +126,11 @@ def normalize_phone(raw: str) -> str:
       coerce to +1########## for consistency.
     - Return empty string if input is obviously missing (e.g., 'N/A').
 
+    Note: `clean_dataframe` applies these same rules to a whole column at
+    once with the pandas .str accessor (both treat any Unicode decimal digit
+    as a digit); this scalar version is handy for one-off values and quick
+    checks.
+
     Examples
     --------
     "(555) 123-4567"   -> "+15551234567"
@@ -81,11 +138,17 @@ def normalize_phone(raw: str) -> str:
     "+44 20 7946 0958" -> "+442079460958" (keeps leading '+')
     "N/A"              -> ""
     """
-    if not raw or raw.strip().lower() in {"n/a", "na", "none"}:
+    s = raw.strip() if raw else ""
+    if not s or s.lower() in _MISSING:
         return ""
 
-    # Keep digits and '+' only. This collapses spaces, dashes, parentheses, etc.
-    digits = re.sub(r"[^\d+]", "", raw)
+    # Fast path: already just digits (optionally after a leading '+'), so
+    # there is nothing for the regex to strip.
+    if s.isdecimal() or (s[:1] == "+" and s[1:].isdecimal()):
+        digits = s
+    else:
+        # Keep digits and '+' only. This collapses spaces, dashes, parentheses, etc.
+        digits = _PHONE_STRIP_RE.sub("", s)
 
     # If there's no '+' prefix, infer US formatting where reasonable.
     if digits and not digits.startswith("+"):
@@ -106,24 +169,17 @@ def normalize_country(raw: Optional[str]) -> str:
     - Trim whitespace
     - Map common variants to canonical labels
     - Fallback to Title Case for unknowns
+
+    Note: `clean_dataframe` does the same lookup column-wise with
+    `Series.map(_COUNTRY_MAP)`.
     """
     if not raw:
         return ""
     s = raw.strip()
 
-    # Known variants map → canonical value
-    mapping = {
-        "usa": "United States",
-        "united states": "United States",
-        "canada": "Canada",
-        "uk": "United Kingdom",
-        "united kingdom": "United Kingdom",
-        "mexico": "Mexico",
-    }
-
     key = s.lower()
-    if key in mapping:
-        return mapping[key]
+    if key in _COUNTRY_MAP:
+        return _COUNTRY_MAP[key]
 
     # Fallback: Title Case (e.g., "bRaZiL" -> "Brazil")
     return s.title()
@@ -132,71 +188,270 @@ def normalize_country(raw: Optional[str]) -> str:
 # ------------------------------
 # HTML parsing helpers
 # ------------------------------
-def parse_company_table(html: str) -> Tuple[List[Dict[str, str]], Optional[str]]:
+
+# Size of the slices we feed the streaming parser. Small enough that each
+# copy out of an mmap'd page stays cheap, large enough to keep calls few.
+FEED_CHUNK_SIZE = 64 * 1024
+
+
+# Pagination only needs the "Next" link's href, which a tiny regex over the
+# raw page finds without any parsing. It requires id before href and skips
+# hrefs with entities ('&'); anything else falls back to the parser's hook.
+# `id` must be a whole attribute name (so `data-id="next"` doesn't count).
+_NEXT_LINK_PATTERN = r"""<a\s(?:[^>]*\s)?id=["']next["'][^>]*\shref=["']([^"'&]+)["']"""
+_NEXT_RE = re.compile(_NEXT_LINK_PATTERN)
+_NEXT_RE_BYTES = re.compile(_NEXT_LINK_PATTERN.encode("ascii"))
+
+
+def _in_html_comment(html: Union[str, bytes, mmap.mmap], pos: int) -> bool:
+    """True if offset `pos` falls inside an unclosed <!-- ... --> before it."""
+    open_, close = ("<!--", "-->") if isinstance(html, str) else (b"<!--", b"-->")
+    start = html.rfind(open_, 0, pos)
+    return start != -1 and html.find(close, start + len(open_), pos) == -1
+
+
+def _find_next_href(html: Union[str, bytes, mmap.mmap]) -> Optional[str]:
+    """
+    Regex scan of the raw page for <a id="next" href="...">; None if missed.
+
+    Matches inside HTML comments (e.g. a commented-out old link) are skipped.
+    """
+    pattern = _NEXT_RE if isinstance(html, str) else _NEXT_RE_BYTES
+    for match in pattern.finditer(html):
+        if _in_html_comment(html, match.start()):
+            continue
+        href = match.group(1)
+        return href if isinstance(href, str) else href.decode("utf-8")
+    return None
+
+
+def _new_column_buffers() -> Dict[str, List[str]]:
+    """One empty list per table column (column-oriented row storage)."""
+    return {name: [] for name in COLUMNS}
+
+
+def _iter_chunks(html: Union[str, bytes, mmap.mmap]) -> Iterator[Union[str, bytes]]:
+    """Slice the page into FEED_CHUNK_SIZE pieces for the streaming parser."""
+    for offset in range(0, len(html), FEED_CHUNK_SIZE):
+        yield html[offset:offset + FEED_CHUNK_SIZE]
+
+
+def _is_company_row(tr: etree._Element) -> bool:
+    """True if `tr` sits in the <tbody> of <table id="company-table">."""
+    tbody = tr.getparent()
+    if tbody is None or tbody.tag != "tbody":
+        return False
+    table = tbody.getparent()
+    return table is not None and table.tag == "table" and table.get("id") == "company-table"
+
+
+def iter_rows(
+    chunks: Iterable[Union[str, bytes]],
+    on_next: Optional[Callable[[str], None]] = None,
+) -> Iterator[List[str]]:
+    """
+    Stream the company table's body rows out of an HTML page.
+
+    The page is fed to lxml's HTMLPullParser piece by piece and each row is
+    handled as soon as its closing </tr> is seen, then freed. We never keep
+    a full DOM of the page around, so memory stays flat however long the
+    table is.
+
+    Parameters
+    ----------
+    chunks : iterable of str or bytes
+        The page content, in order (raw bytes are decoded as UTF-8).
+    on_next : callable, optional
+        Called with the href of each <a id="next"> link as it is parsed.
+        When omitted, <a> elements aren't reported by the parser at all.
+
+    Yields
+    ------
+    list of str
+        The stripped text of each <td> in a row of <table id="company-table">.
+    """
+    tags = ("tr", "a") if on_next is not None else ("tr",)
+    parser = etree.HTMLPullParser(events=("end",), tag=tags, encoding="utf-8")
+
+    def drain() -> Iterator[List[str]]:
+        for _event, elem in parser.read_events():
+            if elem.tag == "a":
+                # Pagination hook: report the "Next" link (if it has a target).
+                href = elem.get("href")
+                if elem.get("id") == "next" and href is not None:
+                    on_next(href)
+                continue
+
+            # Defensive: ignore header rows and rows of any other table.
+            if not _is_company_row(elem):
+                continue
+
+            # Extract text from each <td>, stripping extra whitespace.
+            cells = ["".join(td.itertext()).strip() for td in elem.iterchildren("td")]
+
+            # The row is done: drop it (and earlier rows) from the tree.
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+            yield cells
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        return  # Empty document: nothing to yield
+    yield from drain()
+
+
+def parse_company_table(
+    html: Union[str, bytes, mmap.mmap],
+    find_next: bool = True,
+) -> Tuple[Dict[str, List[str]], Optional[str]]:
     """
     Parse a single HTML page for the company table.
 
     Parameters
     ----------
-    html : str
-        The full HTML content of the page.
+    html : str, bytes or mmap
+        The full HTML content of the page (raw bytes are decoded as UTF-8).
+    find_next : bool
+        Look for the "Next" link. Callers that already know every page (and
+        so ignore `next_href`) can pass False to skip that work.
 
     Returns
     -------
-    rows : list of dict
-        Each dict contains a single row from the table with keys:
+    columns : dict of lists
+        One list of cell values per column, keyed by the names in COLUMNS:
         ["CompanyID", "CompanyName", "Category", "Email", "Phone", "Country"]
+        Storing columns (not one dict per row) avoids a dict per row and lets
+        pandas build each column straight from its list.
     next_href : Optional[str]
         The relative link to the next page (if a "Next" link exists), else None.
+        Always None when `find_next` is False.
     """
-    soup = BeautifulSoup(html, "lxml")
+    columns = _new_column_buffers()
 
-    # Locate the table by id (set in our demo pages).
-    table = soup.find("table", id="company-table")
-    rows: List[Dict[str, str]] = []
-
-    if not table:
-        # Defensive: if the table isn't found, return empty results.
-        return rows, None
-
-    # Iterate over all table body rows.
-    tbody = table.find("tbody")
-    if not tbody:
-        return rows, None
-
-    for tr in tbody.find_all("tr"):
-        # Extract text from each <td>, stripping extra whitespace.
-        cols = [td.get_text(strip=True) for td in tr.find_all("td")]
+    # Find a "Next" link (if present) to handle pagination: first by regex on
+    # the raw page; only if that misses, let the parser's hook collect it.
+    next_href = _find_next_href(html) if find_next else None
+    next_links: List[str] = []
+    on_next = next_links.append if find_next and next_href is None else None
 
+    # Rows arrive from the streaming parser.
+    for cells in iter_rows(_iter_chunks(html), on_next=on_next):
         # Expecting exactly 6 columns; skip malformed rows gracefully.
-        if len(cols) != 6:
+        if len(cells) != len(COLUMNS):
             continue
 
-        rows.append(
-            {
-                "CompanyID": cols[0],
-                "CompanyName": cols[1],
-                "Category": cols[2],
-                "Email": cols[3],
-                "Phone": cols[4],
-                "Country": cols[5],
-            }
-        )
+        for name, value in zip(COLUMNS, cells):
+            columns[name].append(value)
 
-    # Find a "Next" link (if present) to handle pagination.
-    next_link = soup.find("a", id="next")
-    next_href = next_link["href"] if next_link and next_link.has_attr("href") else None
+    if next_href is None and next_links:
+        next_href = next_links[0]
 
-    return rows, next_href
+    return columns, next_href
 
 
 # ------------------------------
 # Scrape/paginate over the demo site
 # ------------------------------
+def _read_with_readahead(path: Path) -> bytes:
+    """
+    Read a page's raw bytes, hinting the kernel that we read it front to back.
+
+    POSIX_FADV_SEQUENTIAL lets the OS enlarge its readahead window, which
+    helps on cold-cache runs. The hint is skipped on platforms without
+    posix_fadvise (e.g. Windows, macOS).
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        size = os.fstat(fd).st_size
+        chunks = []
+        # os.read may return fewer bytes than asked; loop until EOF.
+        while chunk := os.read(fd, max(size, 1)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _parse_page_mmap(path: Path) -> Tuple[Dict[str, List[str]], Optional[str]]:
+    """
+    Parse a page straight from a read-only memory map of the file.
+
+    The streaming parser is fed small slices of the map, so the whole file
+    is never copied into one Python str/bytes object.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return _new_column_buffers(), None  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Same sequential-access hint as _read_with_readahead, via madvise.
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return parse_company_table(mm)
+
+
+def _enumerate_pages(site_dir: Path) -> List[Path]:
+    """
+    List the demo pages (page1.html, page2.html, ...) in numeric order.
+
+    Sorting numerically (not alphabetically) keeps page10.html after
+    page9.html. Returns an empty list if nothing matches.
+    """
+    numbered = []
+    for path in site_dir.glob("page*.html"):
+        match = _PAGE_NAME_RE.fullmatch(path.name)
+        if match:
+            numbered.append((int(match.group(1)), path))
+    return [path for _, path in sorted(numbered)]
+
+
+def _extend_columns(columns: Dict[str, List[str]], page_columns: Dict[str, List[str]]) -> None:
+    """Append one page's column values onto the running buffers."""
+    for name, values in page_columns.items():
+        columns[name].extend(values)
+
+
+def _scrape_pages_concurrently(pages: List[Path], columns: Dict[str, List[str]]) -> None:
+    """
+    Read and parse a known list of pages in parallel.
+
+    A thread pool reads the files (I/O bound). Once every read is done (and
+    the reader threads have exited, so the process pool never forks a
+    multi-threaded process), the pages are parsed: inline for small sites,
+    or on a process pool (CPU bound) once there is enough HTML to repay
+    starting the workers. Rows are appended to `columns` in page order.
+    """
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as readers:
+        pages_html = list(readers.map(_read_with_readahead, pages))
+
+    # Every page is already known, so skip "Next" link discovery.
+    parse_page = partial(parse_company_table, find_next=False)
+    if len(pages_html) < 2 or sum(map(len, pages_html)) < PARALLEL_PARSE_MIN_BYTES:
+        results = [parse_page(html) for html in pages_html]
+    else:
+        workers = min(len(pages_html), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as parsers:
+            results = list(parsers.map(parse_page, pages_html))
+
+    for page_columns, _next_href in results:
+        _extend_columns(columns, page_columns)
+
+
 def scrape_demo_site(start_page: str = "page1.html") -> pd.DataFrame:
     """
     Walk the local demo site pages, parse each table, and accumulate rows.
 
+    When the pages follow the pageN.html naming they are read and parsed
+    concurrently; otherwise we fall back to following "next" links.
+
     Parameters
     ----------
     start_page : str
@@ -207,9 +462,31 @@ def scrape_demo_site(start_page: str = "page1.html") -> pd.DataFrame:
     pd.DataFrame
         Raw, uncleaned rows from all pages concatenated together.
     """
-    current = (SITE_DIR / start_page).resolve()
+    # Fast path: if the pages follow the pageN.html naming, read and parse
+    # them all at once, starting from `start_page`.
+    columns = _new_column_buffers()
+    pages = _enumerate_pages(SITE_DIR)
+    start = SITE_DIR / start_page
+    if start in pages:
+        _scrape_pages_concurrently(pages[pages.index(start):], columns)
+    else:
+        _follow_next_links(start, columns)
+
+    # Convert the dict of column lists → DataFrame
+    df = pd.DataFrame(columns, columns=COLUMNS)
+    return df
+
+
+def _follow_next_links(start: Path, columns: Dict[str, List[str]]) -> None:
+    """
+    Fallback: walk pages one at a time by following each "next" link,
+    appending rows to `columns`.
+    """
+    # All demo pages live in one directory: resolve it once up front rather
+    # than resolving (a chain of stat calls) every page we visit.
+    base = start.parent.resolve()
+    current = base / start.name
     seen = set()  # Protect against accidental loops
-    all_rows: List[Dict[str, str]] = []
 
     # Traverse pages until no "next" link is found.
     while current and current.exists():
@@ -217,16 +494,11 @@ def scrape_demo_site(start_page: str = "page1.html") -> pd.DataFrame:
             break  # Safety: avoid infinite loops on circular pagination
         seen.add(current)
 
-        html = current.read_text(encoding="utf-8")
-        rows, next_href = parse_company_table(html)
-        all_rows.extend(rows)
+        page_columns, next_href = _parse_page_mmap(current)
+        _extend_columns(columns, page_columns)
 
         # Move to next page if available; else stop.
-        current = (current.parent / next_href).resolve() if next_href else None
-
-    # Convert the list of dicts → DataFrame
-    df = pd.DataFrame(all_rows, columns=["CompanyID", "CompanyName", "Category", "Email", "Phone", "Country"])
-    return df
+        current = base / next_href if next_href else None
 
 
 # ------------------------------
@@ -238,47 +510,80 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 
     Steps
     -----
-    - Convert CompanyID to integer (nullable Int64 for safety)
+    - Convert CompanyID to integer (nullable Int32 when ids fit, else Int64)
     - Trim/Title-Case names & categories
     - Lowercase & trim emails; empty strings become NaN
     - Normalize phone numbers into a consistent canonical form
     - Normalize countries to canonical labels
     - Drop duplicates on (CompanyID, Email)
+    - Store low-cardinality columns (Category, Country) as `category` dtype
 
     Returns
     -------
     pd.DataFrame
         Cleaned, deduplicated DataFrame.
     """
-    # Convert to numeric safely; non-convertible become <NA> (nullable Int64)
-    df["CompanyID"] = pd.to_numeric(df["CompanyID"], errors="coerce").astype("Int64")
-
-    # Basic text normalization
-    df["CompanyName"] = df["CompanyName"].astype(str).str.strip().str.title()
-    df["Category"]    = df["Category"].astype(str).str.strip().str.title()
+    # Convert to numeric safely; non-convertible become <NA>. Use nullable
+    # Int32 when every id fits in 32 bits (half the memory of Int64 for
+    # hashing/dedup), falling back to Int64 for larger ids.
+    ids = pd.to_numeric(df["CompanyID"], errors="coerce")
+    fits_int32 = ids.isna().all() or (ids.min() >= -(2**31) and ids.max() <= 2**31 - 1)
+    df["CompanyID"] = ids.astype("Int32" if fits_int32 else "Int64")
+
+    # Basic text normalization: one chained strip → title pass per column,
+    # running entirely on the Arrow string kernels (no object round-trip)
+    for col in ("CompanyName", "Category"):
+        df[col] = df[col].astype(TEXT_DTYPE).str.strip().str.title()
 
     # Emails: lowercase, strip spaces; coerce empty strings to NaN
     df["Email"] = (
         df["Email"]
-        .astype(str)
+        .astype(TEXT_DTYPE)
         .str.strip()
         .str.lower()
         .replace({"": pd.NA})
     )
 
-    # Phones: normalize via helper; coerce empty strings to NaN
-    df["Phone"] = (
-        df["Phone"]
-        .astype(str)
-        .map(normalize_phone)
-        .replace({"": pd.NA})
-    )
+    # Phones: same rules as `normalize_phone`, but vectorized with the .str
+    # accessor so we avoid one Python call + regex per row.
+    phone = df["Phone"].astype(TEXT_DTYPE).str.strip().str.lower()
+    phone_missing = phone.isin(_MISSING) | phone.isna()
 
-    # Countries: controlled vocabulary via helper
-    df["Country"] = df["Country"].apply(normalize_country)
+    # Keep digits and '+' only. This collapses spaces, dashes, parentheses, etc.
+    # (Pass a pattern string: a compiled re would push Arrow strings back
+    # onto the per-element Python path. It's the RE2 spelling of
+    # _PHONE_STRIP_RE, so the same characters count as digits.) One regex
+    # pass over the whole column is cheaper than masking out clean values.
+    digits = phone.str.replace(_PHONE_STRIP_ARROW_PATTERN, "", regex=True)
 
-    # Remove duplicate rows by a logical business key
-    df = df.drop_duplicates(subset=["CompanyID", "Email"], keep="first")
+    # If there's no '+' prefix, infer US formatting where reasonable.
+    no_plus = ~digits.str.startswith("+", na=False)
+    len11 = digits.str.len().eq(11) & digits.str.startswith("1", na=False) & no_plus
+    len10 = digits.str.len().eq(10) & no_plus
+    digits.loc[len11] = "+" + digits.loc[len11]
+    digits.loc[len10] = "+1" + digits.loc[len10]
+
+    # Missing markers and empty results become NaN
+    digits.loc[phone_missing | digits.eq("")] = pd.NA
+    df["Phone"] = digits
+
+    # Countries: controlled vocabulary via a dict lookup over the whole
+    # column; unknown values fall back to Title Case (like `normalize_country`)
+    country = df["Country"].fillna("").astype(TEXT_DTYPE).str.strip()
+    canonical = country.str.lower().map(_COUNTRY_MAP)
+    df["Country"] = canonical.where(canonical.notna(), country.str.title())
+
+    # Remove duplicate rows by a logical business key. Hash the key columns
+    # once (vectorized) and dedup on the uint64 hashes rather than on mixed
+    # (int, str) tuples; missing values hash equal, as in drop_duplicates.
+    key = pd.util.hash_pandas_object(df[["CompanyID", "Email"]], index=False)
+    # (.copy(): the columns below are reassigned on this row subset)
+    df = df.loc[~key.duplicated(keep="first")].copy()
+
+    # Only a handful of distinct values: keep small integer codes + a lookup
+    # table instead of one string object per row.
+    for col in ("Category", "Country"):
+        df[col] = df[col].astype("category")
 
     return df
 
@@ -286,6 +591,73 @@ def clean_dataframe(df: pd.DataFrame) -> pd.DataFrame:
 # ------------------------------
 # Persistence (CSV + SQLite)
 # ------------------------------
+
+# One open SQLite connection per database file, reused across save_outputs
+# calls (e.g. when this module runs inside a long-lived process). Any thread
+# may use a cached connection, but only while holding _DB_LOCK, so a single
+# write transaction runs at a time.
+_CONNECTIONS: Dict[Path, sqlite3.Connection] = {}
+_DB_LOCK = threading.Lock()
+
+# Fixed schema for the companies table. CompanyID isn't a primary key: dedup
+# is on (CompanyID, Email), so an id may legitimately repeat or be missing.
+# A plain index still gives O(log n) lookups by id.
+_CREATE_COMPANIES_SQL = """CREATE TABLE companies (
+    CompanyID   INTEGER,
+    CompanyName TEXT,
+    Category    TEXT,
+    Email       TEXT,
+    Phone       TEXT,
+    Country     TEXT
+)"""
+_CREATE_COMPANIES_ID_INDEX_SQL = "CREATE INDEX IF NOT EXISTS companies_id ON companies(CompanyID)"
+
+# Same SQL text on the same connection → sqlite3 reuses its prepared statement.
+_INSERT_COMPANY_SQL = "INSERT INTO companies VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def _get_conn(db_path: Path) -> sqlite3.Connection:
+    """
+    Return the cached connection for `db_path`, opening it on first use.
+
+    The bulk-load PRAGMAs are set once, when the connection is opened. They
+    trade crash-safety for speed, which is fine for a file we fully rewrite
+    on every run. The rollback journal is kept in memory rather than turned
+    off, so a failed load can still ROLLBACK cleanly. The connection is in autocommit mode; callers wrap their
+    writes in an explicit BEGIN ... COMMIT.
+
+    Callers must hold _DB_LOCK while calling this and using the connection.
+    """
+    conn = _CONNECTIONS.get(db_path)
+    if conn is not None and not db_path.exists():
+        # The file was removed behind our back; don't keep writing to it.
+        conn.close()
+        conn = None
+    if conn is None:
+        # check_same_thread=False: the connection is shared across threads,
+        # with _DB_LOCK serializing access instead.
+        conn = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+        conn.executescript(
+            """
+            PRAGMA journal_mode=MEMORY;
+            PRAGMA synchronous=OFF;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-200000;
+            """
+        )
+        _CONNECTIONS[db_path] = conn
+    return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    """Close every cached SQLite connection when the interpreter exits."""
+    with _DB_LOCK:
+        for conn in _CONNECTIONS.values():
+            conn.close()
+        _CONNECTIONS.clear()
+
+
 def save_outputs(df: pd.DataFrame) -> None:
     """
     Save the cleaned DataFrame to CSV and a SQLite database.
@@ -296,12 +668,44 @@ def save_outputs(df: pd.DataFrame) -> None:
     csv_path = OUTPUT_DIR / "companies.csv"
     db_path = OUTPUT_DIR / "companies.db"
 
-    # 1) CSV export
-    df.to_csv(csv_path, index=False)
-
-    # 2) SQLite export
-    with sqlite3.connect(db_path) as conn:
-        df.to_sql("companies", conn, if_exists="replace", index=False)
+    # 1) CSV export via Arrow's C++ writer, streamed in record batches
+    #    (string fields come out quoted; categorical columns as their labels).
+    #    Frames Arrow can't represent (e.g. an object column mixing ints and
+    #    strings) fall back to pandas' own writer.
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pv.write_csv(table, csv_path, write_options=pv.WriteOptions(batch_size=8192))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        df.to_csv(csv_path, index=False)
+
+    # 2) SQLite export: explicit schema + one bulk executemany in a single
+    #    transaction, on a connection that is reused across calls.
+    #    SQLite has no category type, so astype(object) turns categorical
+    #    columns back into plain labels before binding.
+    rows = list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+    with _DB_LOCK:
+        conn = _get_conn(db_path)
+        conn.execute("BEGIN")
+        try:
+            #    If the table already has this exact schema, just empty it: a
+            #    schema change would force the cached INSERT to be re-prepared.
+            existing = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'companies'"
+            ).fetchone()
+            if existing is not None and existing[0] == _CREATE_COMPANIES_SQL:
+                conn.execute("DELETE FROM companies")
+            else:
+                conn.execute("DROP TABLE IF EXISTS companies")
+                conn.execute(_CREATE_COMPANIES_SQL)
+            conn.executemany(_INSERT_COMPANY_SQL, rows)
+            #    On a fresh table the id index is built once, after the load
+            #    (cheaper than updating it row by row); otherwise it's kept.
+            conn.execute(_CREATE_COMPANIES_ID_INDEX_SQL)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
 
     # Console summary
     print(f"Saved CSV    → {csv_path}")